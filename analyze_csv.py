@@ -4,43 +4,129 @@ CLI utility to analyze a CSV from disk and print stats to stdout.
 """
 
 import argparse
-import csv
 import io
+import sys
 from pathlib import Path
 
 import pandas as pd
 import numpy as np
 
 
-def sniff_delimiter(sample_text: str) -> str:
-    try:
-        dialect = csv.Sniffer().sniff(sample_text, delimiters=[",", ";", "\t", "|", ":"])
-        return dialect.delimiter
-    except Exception:
+def sniff_delimiter(sample_bytes: bytes) -> str:
+    """Pick the candidate delimiter with the most consistent per-line count."""
+    if not sample_bytes:
+        return ","
+    present = [chr(c) for c in b",;\t|:" if sample_bytes.count(c) > 0]
+    if not present:
         return ","
+    if len(present) == 1:
+        return present[0]
+    arr = np.frombuffer(sample_bytes, dtype=np.uint8)
+    line_starts = np.concatenate(([0], np.flatnonzero(arr == 0x0A) + 1))
+    if line_starts[-1] >= arr.size:
+        line_starts = line_starts[:-1]
+    best_delim = ","
+    best_var = np.inf
+    for cand in b",;\t|:":
+        counts = np.add.reduceat((arr == cand).astype(np.int64), line_starts)
+        if counts.size > 1 and not sample_bytes.endswith(b"\n"):
+            counts = counts[:-1]
+        if counts.mean() == 0:
+            continue
+        var = counts.var()
+        if var < best_var:
+            best_var = var
+            best_delim = chr(cand)
+    return best_delim
+
+
+def detect_encoding(head: bytes) -> str:
+    """Probe the first 4 KB for UTF-8, trimming a cut multibyte tail first."""
+    probe = head[:4096]
+    end = len(probe)
+    if len(head) > len(probe):
+        while end > 0 and end > len(probe) - 4 and probe[end - 1] & 0xC0 == 0x80:
+            end -= 1
+        if end > 0 and probe[end - 1] >= 0xC0:
+            end -= 1
+    try:
+        probe[:end].decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _read_csv_any(path: Path, data_bytes: bytes, sep: str, encoding: str) -> pd.DataFrame:
+    """C engine first, then python-engine sep auto-detection, then CleverCSV."""
+    try:
+        return pd.read_csv(
+            io.BytesIO(data_bytes),
+            sep=sep,
+            engine="c",
+            low_memory=False,
+            encoding=encoding,
+        )
+    except pd.errors.ParserError:
+        try:
+            return pd.read_csv(io.BytesIO(data_bytes), sep=None, engine="python", encoding=encoding)
+        except pd.errors.ParserError as exc:
+            # Last resort: CleverCSV dialect detection (optional dependency)
+            try:
+                import clevercsv
+            except ImportError:
+                raise exc
+            return clevercsv.read_dataframe(str(path), encoding=encoding)
 
 
 def read_csv_with_fallback(path: Path):
     data_bytes = path.read_bytes()
-    encoding_used = "utf-8"
+    head = data_bytes[:10000]
+    encoding_used = detect_encoding(head)
+    detected_delimiter = sniff_delimiter(head)
     try:
-        text = data_bytes.decode("utf-8")
+        df = _read_csv_any(path, data_bytes, detected_delimiter, encoding_used)
     except UnicodeDecodeError:
-        text = data_bytes.decode("latin-1")
+        # The head probe can miss a non-UTF-8 byte deeper in the file;
+        # latin-1 decodes any byte sequence, so one retry always recovers.
         encoding_used = "latin-1"
-    detected_delimiter = sniff_delimiter(text[:10000])
-    df = pd.read_csv(io.StringIO(text), sep=None, engine="python", low_memory=False)
+        df = _read_csv_any(path, data_bytes, detected_delimiter, encoding_used)
     return df, encoding_used, detected_delimiter
 
 
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink numeric columns to the smallest dtype that holds the values exactly."""
+    for c in df.select_dtypes(include=[np.number]).columns:
+        df[c] = pd.to_numeric(
+            df[c],
+            downcast="integer" if pd.api.types.is_integer_dtype(df[c]) else "float",
+        )
+    return df
+
+
+def estimate_memory_usage(df: pd.DataFrame, sample: int = 1024):
+    """Estimate memory by sampling object columns; returns (bytes, sampled)."""
+    base = int(df.memory_usage(deep=False).sum())
+    extra = 0
+    sampled = False
+    for col in df.columns[df.dtypes == object]:
+        s = df[col]
+        n = len(s)
+        if n == 0:
+            continue
+        if n > sample:
+            idx = np.random.randint(0, n, size=sample)
+            sampled = True
+        else:
+            idx = np.arange(n)
+        mean_size = np.mean([sys.getsizeof(s.iat[i]) for i in idx])
+        extra += int(mean_size * n)
+    return base + extra, sampled
+
+
 def human_bytes(num: int) -> str:
     symbols = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    f = float(num)
-    while f >= 1024 and i < len(symbols) - 1:
-        f /= 1024.0
-        i += 1
-    return f"{f:.2f} {symbols[i]}"
+    i = min((max(num, 1).bit_length() - 1) // 10, len(symbols) - 1)
+    return f"{num / (1 << (10 * i)):.2f} {symbols[i]}"
 
 
 def main():
@@ -52,19 +138,23 @@ def main():
 
     rows = len(df)
     cols = df.shape[1]
+    # Report the dtypes as parsed, then downcast for the stats passes
     dtypes_df = pd.DataFrame({"Column": df.columns, "Dtype": [str(dt) for dt in df.dtypes]})
-    missing_per_col = df.isna().sum().reset_index()
-    missing_per_col.columns = ["Column", "Missing"]
+    df = downcast_numeric(df)
+    missing_counts = df.isna().to_numpy().sum(axis=0)
+    missing_per_col = pd.DataFrame({"Column": df.columns, "Missing": missing_counts})
     total_cells = rows * cols
-    overall_missing = int(missing_per_col["Missing"].sum())
+    overall_missing = int(missing_counts.sum())
     overall_missing_pct = (overall_missing / total_cells * 100.0) if total_cells > 0 else 0.0
-    duplicates_count = int(df.duplicated().sum())
-    dup_preview_df = df[df.duplicated()].head(10)
+    dup_mask = df.duplicated()
+    duplicates_count = int(dup_mask.sum())
+    # Materialize only the 10 rows actually shown
+    dup_preview_df = df.iloc[np.flatnonzero(dup_mask.to_numpy())[:10]]
     numeric_df = df.select_dtypes(include=[np.number])
     has_numeric = not numeric_df.empty
-    numeric_summary_df = df.describe(include=[np.number]).round(3) if has_numeric else pd.DataFrame()
+    numeric_summary_df = numeric_df.describe().round(3) if has_numeric else pd.DataFrame()
     preview_df = df.head(10)
-    mem_usage_bytes = int(df.memory_usage(deep=True).sum())
+    mem_usage_bytes, mem_usage_sampled = estimate_memory_usage(df)
 
     print("# CSV Analysis")
     print(f"- File: {args.csv_path}")
@@ -99,7 +189,8 @@ def main():
     print(preview_df.to_string(index=False))
     print()
     print("## Memory usage")
-    print(f"- {mem_usage_bytes} bytes ({human_bytes(mem_usage_bytes)})")
+    suffix = " (sampled estimate)" if mem_usage_sampled else ""
+    print(f"- {mem_usage_bytes} bytes ({human_bytes(mem_usage_bytes)}){suffix}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,11 @@
 import os
-import io
-import csv
+import sys
+import html
+import hashlib
 import logging
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple, Dict, Any
 
 from flask import Flask, render_template, request, flash, jsonify
@@ -11,11 +15,348 @@ from werkzeug.exceptions import RequestEntityTooLarge
 import pandas as pd
 import numpy as np
 
+from duplicates import HAVE_NUMBA as HAVE_DUP_KERNEL, dup_mask_numeric
+from describe import HAVE_NUMBA as HAVE_DESCRIBE_KERNEL, describe_numeric
+
 
-ALLOWED_EXTENSIONS = {"csv"}
 # Configurable max upload size (in MB) via env MAX_CONTENT_LENGTH_MB or UPLOAD_MAX_MB; defaults to 10 MB
 MAX_CONTENT_LENGTH_MB = int(os.getenv("MAX_CONTENT_LENGTH_MB", os.getenv("UPLOAD_MAX_MB", "10")))
 MAX_CONTENT_LENGTH = MAX_CONTENT_LENGTH_MB * 1024 * 1024  # bytes
+# Number of analysis results kept for identical re-uploads (LRU)
+ANALYSIS_CACHE_SIZE = 32
+# Wall-clock cap for one analysis in the worker pool
+ANALYSIS_TIMEOUT_SECONDS = 60
+
+
+def human_bytes(num: int) -> str:
+    """
+    Convert a byte count into a human-readable string.
+    """
+    symbols = ["B", "KB", "MB", "GB", "TB"]
+    # Unit index straight from the bit length: 2**10 per step, capped at TB
+    i = min((max(num, 1).bit_length() - 1) // 10, len(symbols) - 1)
+    return f"{num / (1 << (10 * i)):.2f} {symbols[i]}"
+
+
+def estimate_memory_usage(df: pd.DataFrame, sample: int = 1024) -> Tuple[int, bool]:
+    """
+    Estimate the DataFrame's memory footprint. memory_usage(deep=True)
+    walks every Python object in every object column, so instead we
+    sample up to `sample` rows per object column and scale up. Returns
+    (bytes, sampled) where `sampled` flags an estimate rather than an
+    exact count.
+    """
+    base = int(df.memory_usage(deep=False).sum())
+    extra = 0
+    sampled = False
+    for col in df.columns[df.dtypes == object]:
+        s = df[col]
+        n = len(s)
+        if n == 0:
+            continue
+        if n > sample:
+            idx = np.random.randint(0, n, size=sample)
+            sampled = True
+        else:
+            idx = np.arange(n)
+        mean_size = np.mean([sys.getsizeof(s.iat[i]) for i in idx])
+        extra += int(mean_size * n)
+    return base + extra, sampled
+
+
+def sniff_delimiter(sample_bytes: bytes) -> str:
+    """
+    Pick the most likely delimiter from a raw byte sample: for each
+    candidate, count occurrences per line in one vectorized pass and choose
+    the one with the most consistent (lowest-variance) count. Avoids
+    csv.Sniffer's regex, which can backtrack pathologically. Defaults to
+    comma if nothing matches.
+    """
+    if not sample_bytes:
+        return ","
+    # Fast path: with zero or one candidate present there is nothing to
+    # score, so skip the per-line histogram pass entirely.
+    present = [chr(c) for c in b",;\t|:" if sample_bytes.count(c) > 0]
+    if not present:
+        return ","
+    if len(present) == 1:
+        return present[0]
+    arr = np.frombuffer(sample_bytes, dtype=np.uint8)
+    line_starts = np.concatenate(([0], np.flatnonzero(arr == 0x0A) + 1))
+    if line_starts[-1] >= arr.size:
+        line_starts = line_starts[:-1]
+    best_delim = ","
+    best_var = np.inf
+    for cand in b",;\t|:":
+        counts = np.add.reduceat((arr == cand).astype(np.int64), line_starts)
+        if counts.size > 1 and not sample_bytes.endswith(b"\n"):
+            # The sample may cut the last line short; don't let it skew the variance.
+            counts = counts[:-1]
+        if counts.mean() == 0:
+            continue
+        var = counts.var()
+        # Strict < keeps the earlier candidate on ties (prefer , ; \t | :)
+        if var < best_var:
+            best_var = var
+            best_delim = chr(cand)
+    return best_delim
+
+
+def detect_encoding(head: bytes) -> str:
+    """
+    Probe the first 4 KB of the file: decodes as UTF-8 means utf-8,
+    otherwise fall back to latin-1. Trailing bytes that may belong to a
+    multibyte sequence cut by the probe boundary are dropped first, so a
+    truncated sample can't force the fallback on valid UTF-8 files.
+    """
+    probe = head[:4096]
+    end = len(probe)
+    if len(head) > len(probe):
+        # The probe cut the file mid-stream; drop bytes that may belong to
+        # a split multibyte sequence. A complete short file is left intact.
+        while end > 0 and end > len(probe) - 4 and probe[end - 1] & 0xC0 == 0x80:
+            end -= 1  # continuation byte, possibly mid-sequence
+        if end > 0 and probe[end - 1] >= 0xC0:
+            end -= 1  # lead byte with its tail cut off
+    try:
+        probe[:end].decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _read_csv_any(path: str, sep: str, encoding: str) -> pd.DataFrame:
+    """
+    Parse with the C engine and the sniffed delimiter; pandas reads the
+    mapped bytes directly, so no full-file str is ever materialized. The
+    python engine's sep auto-detection is kept as a fallback, and CleverCSV's
+    consistency-based dialect detection as a last resort -- it recovers files
+    both our sniffer and pandas get wrong. CleverCSV is an optional
+    dependency; without it the ParserError surfaces as before. Runtime is
+    capped by the worker pool's result timeout.
+    """
+    try:
+        return pd.read_csv(
+            path,
+            sep=sep,
+            engine="c",
+            low_memory=False,
+            encoding=encoding,
+            memory_map=True,
+        )
+    except pd.errors.ParserError:
+        try:
+            return pd.read_csv(path, sep=None, engine="python", encoding=encoding)
+        except pd.errors.ParserError as exc:
+            try:
+                import clevercsv
+            except ImportError:
+                raise exc
+            return clevercsv.read_dataframe(path, encoding=encoding)
+
+
+def parse_csv_file(path: str, head: bytes) -> Tuple[pd.DataFrame, str, str]:
+    """
+    Detect encoding and delimiter from the head of the saved upload, then
+    parse the file with pandas. memory_map=True lets pandas mmap the file,
+    so the OS page cache -- not the Python heap -- holds the contents.
+
+    Returns: (DataFrame, encoding_used, detected_delimiter)
+    """
+    encoding_used = detect_encoding(head)
+    detected_delimiter = sniff_delimiter(head)
+
+    try:
+        df = _read_csv_any(path, detected_delimiter, encoding_used)
+    except UnicodeDecodeError:
+        # The head probe can miss a non-UTF-8 byte deeper in the file;
+        # latin-1 decodes any byte sequence, so one retry always recovers.
+        encoding_used = "latin-1"
+        df = _read_csv_any(path, detected_delimiter, encoding_used)
+    return df, encoding_used, detected_delimiter
+
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink the int64/float64 columns read_csv produces to the smallest dtype
+    that holds the values exactly (pd.to_numeric round-trips before
+    downcasting), so the stats passes (isna, duplicated, describe) touch
+    fewer bytes. Mutates and returns df.
+    """
+    for c in df.select_dtypes(include=[np.number]).columns:
+        df[c] = pd.to_numeric(
+            df[c],
+            downcast="integer" if pd.api.types.is_integer_dtype(df[c]) else "float",
+        )
+    return df
+
+
+def duplicated_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Row-duplicate mask (keep='first'). All-numeric frames go through the
+    FNV-hash kernel in duplicates.py when numba is installed; everything
+    else uses pandas' df.duplicated().
+    """
+    if HAVE_DUP_KERNEL and len(df) > 0 and df.select_dtypes(exclude=[np.number]).empty:
+        values = df.to_numpy()
+        # Any int/float width works: the kernel views the array at its
+        # native word size, so downcast frames keep their memory win
+        if values.dtype.kind in "iuf":
+            return dup_mask_numeric(values)
+    return df.duplicated().to_numpy()
+
+
+def compute_stats(df: pd.DataFrame, dtypes_rows=None) -> Dict[str, Any]:
+    """
+    Compute required statistics and previews for the given DataFrame.
+    dtypes_rows, when given, overrides the reported dtypes (used to show
+    the dtypes as parsed rather than post-downcast).
+    """
+    rows = len(df)
+    cols = df.shape[1]
+
+    if dtypes_rows is None:
+        dtypes_rows = list(zip(df.columns, (str(dt) for dt in df.dtypes)))
+
+    # One contiguous NumPy reduction instead of a per-column pandas sum
+    missing_counts = df.isna().to_numpy().sum(axis=0)
+    missing_rows = list(zip(df.columns, missing_counts.tolist()))
+
+    total_cells = rows * cols
+    overall_missing = int(missing_counts.sum())
+    overall_missing_pct = (overall_missing / total_cells * 100.0) if total_cells > 0 else 0.0
+
+    # Hash the rows once; the preview slice is taken from the mask by the caller
+    dup_mask = duplicated_mask(df)
+    duplicates_count = int(dup_mask.sum())
+
+    numeric_df = df.select_dtypes(include=[np.number])
+    has_numeric = not numeric_df.empty
+    if has_numeric:
+        # Describe the already-selected numeric frame (skips a second dtype
+        # scan), show metric names, and format numbers with commas/2-decimals.
+        # The Numba kernel fuses all describe metrics into one pass per column.
+        if HAVE_DESCRIBE_KERNEL:
+            numeric_summary_df = describe_numeric(numeric_df).round(2)
+        else:
+            numeric_summary_df = numeric_df.describe().round(2)
+        numeric_summary_df = numeric_summary_df.reset_index().rename(columns={"index": "Metric"})
+        for col in numeric_summary_df.columns:
+            if col != "Metric":
+                numeric_summary_df[col] = numeric_summary_df[col].map(
+                    lambda v: format(v, ",.2f") if pd.notna(v) else ""
+                )
+    else:
+        numeric_summary_df = pd.DataFrame()
+
+    mem_usage_bytes, mem_usage_sampled = estimate_memory_usage(df)
+
+    return {
+        "rows": rows,
+        "cols": cols,
+        "dtypes_rows": dtypes_rows,
+        "missing_rows": missing_rows,
+        "overall_missing": overall_missing,
+        "overall_missing_pct": overall_missing_pct,
+        "duplicates_count": duplicates_count,
+        "dup_mask": dup_mask,
+        "has_numeric": has_numeric,
+        "numeric_summary_df": numeric_summary_df,
+        "mem_usage_bytes": mem_usage_bytes,
+        "mem_usage_sampled": mem_usage_sampled,
+    }
+
+
+def simple_html_table(cols, rows) -> str:
+    """
+    Render a small two-column summary table straight to HTML with string
+    joins, skipping pandas' per-cell to_html machinery. All values are
+    escaped; classes match df_to_html so the tables style identically.
+    """
+    head = "".join(f"<th>{html.escape(str(c))}</th>" for c in cols)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(v))}</td>" for v in row) + "</tr>"
+        for row in rows
+    )
+    return (
+        '<table border="0" class="dataframe table table-striped table-sm table-hover">'
+        f"<thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+    )
+
+
+def df_to_html(df: pd.DataFrame) -> str:
+    """
+    Render a DataFrame to sanitized HTML with Bootstrap table classes.
+    """
+    return df.to_html(
+        classes="table table-striped table-sm table-hover",
+        index=False,
+        escape=True,
+        border=0,
+    )
+
+
+def analyze_file(path: str, head: bytes) -> Dict[str, Any]:
+    """
+    Full analysis pipeline for one saved upload: parse, compute stats, and
+    render the HTML fragments. Runs in a worker process, so the render
+    context it returns (strings and scalars only, no DataFrames) is cheap
+    to send back to the web worker.
+    """
+    df, encoding_used, detected_delimiter = parse_csv_file(path, head)
+    # Report the dtypes as parsed, then downcast for the stats passes
+    dtypes_rows = list(zip(df.columns, (str(dt) for dt in df.dtypes)))
+    df = downcast_numeric(df)
+    stats = compute_stats(df, dtypes_rows=dtypes_rows)
+    # Slice previews here, right before rendering: only the 10 rows shown are
+    # ever copied out of df (first 10 duplicate positions via the mask).
+    dup_idx = np.flatnonzero(stats["dup_mask"])[:10]
+    return {
+        "encoding_used": encoding_used,
+        "detected_delimiter": detected_delimiter,
+        "rows": stats["rows"],
+        "cols": stats["cols"],
+        "dtypes_html": simple_html_table(("Column", "Dtype"), stats["dtypes_rows"]),
+        "missing_per_col_html": simple_html_table(("Column", "Missing"), stats["missing_rows"]),
+        "overall_missing": stats["overall_missing"],
+        "overall_missing_pct": round(stats["overall_missing_pct"], 2),
+        "duplicates_count": stats["duplicates_count"],
+        "dup_preview_html": df_to_html(df.iloc[dup_idx]) if stats["duplicates_count"] > 0 else None,
+        "has_numeric": stats["has_numeric"],
+        "numeric_summary_html": df_to_html(stats["numeric_summary_df"]) if stats["has_numeric"] else None,
+        "preview_html": df_to_html(df.head(10)),
+        "mem_usage_bytes": stats["mem_usage_bytes"],
+        "mem_usage_human": human_bytes(stats["mem_usage_bytes"]),
+        "mem_usage_sampled": stats["mem_usage_sampled"],
+    }
+
+
+def preview_file(path: str, head: bytes) -> Dict[str, Any]:
+    """
+    Quick-preview pipeline: parse only the first 10 data rows (nrows=10)
+    and render just the dtypes and preview panels -- O(first block) work
+    no matter how large the file is. The full stats pass is skipped.
+    """
+    encoding_used = detect_encoding(head)
+    detected_delimiter = sniff_delimiter(head)
+    try:
+        df = pd.read_csv(path, sep=detected_delimiter, engine="c", nrows=10, encoding=encoding_used)
+    except UnicodeDecodeError:
+        # Head probe missed a non-UTF-8 byte in the first rows; retry latin-1
+        encoding_used = "latin-1"
+        df = pd.read_csv(path, sep=detected_delimiter, engine="c", nrows=10, encoding=encoding_used)
+    except pd.errors.ParserError:
+        df = pd.read_csv(path, sep=None, engine="python", nrows=10, encoding=encoding_used)
+    return {
+        "preview_only": True,
+        "encoding_used": encoding_used,
+        "detected_delimiter": detected_delimiter,
+        "cols": df.shape[1],
+        "dtypes_html": simple_html_table(
+            ("Column", "Dtype"), list(zip(df.columns, (str(dt) for dt in df.dtypes)))
+        ),
+        "preview_html": df_to_html(df),
+    }
 
 
 def create_app(testing: bool = False) -> Flask:
@@ -34,6 +375,14 @@ def create_app(testing: bool = False) -> Flask:
     )
     app.logger.setLevel(logging.INFO)
 
+    # Rendered analysis contexts (sans filename) keyed by upload digest, so
+    # re-uploading an identical file skips parse, stats, and HTML rendering.
+    analysis_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+    # Analyses run in worker processes so one large CSV does not pin this
+    # web worker (or the GIL) for the whole parse + stats pipeline.
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
     @app.after_request
     def after_request(response):
         app.logger.info(
@@ -46,118 +395,8 @@ def create_app(testing: bool = False) -> Flask:
         return response
 
     def allowed_file(filename: str) -> bool:
-        return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
-
-    def human_bytes(num: int) -> str:
-        """
-        Convert a byte count into a human-readable string.
-        """
-        symbols = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        f = float(num)
-        while f >= 1024 and i < len(symbols) - 1:
-            f /= 1024.0
-            i += 1
-        return f"{f:.2f} {symbols[i]}"
-
-    def sniff_delimiter(sample_text: str) -> str:
-        """
-        Try to sniff the delimiter from a text sample. Default to comma if unknown.
-        """
-        try:
-            dialect = csv.Sniffer().sniff(sample_text, delimiters=[",", ";", "\t", "|", ":"])
-            return dialect.delimiter
-        except Exception:
-            return ","
-
-    def parse_csv_bytes(data_bytes: bytes) -> Tuple[pd.DataFrame, str, str]:
-        """
-        Decode uploaded bytes, detect delimiter for display, and parse CSV with pandas.
-
-        Returns: (DataFrame, encoding_used, detected_delimiter)
-        """
-        encoding_used = "utf-8"
-        try:
-            text = data_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            text = data_bytes.decode("latin-1")
-            encoding_used = "latin-1"
-
-        sample = text[:10000]
-        detected_delimiter = sniff_delimiter(sample)
-
-        # Let pandas auto-detect the separator (sep=None) with python engine
-        # Note: low_memory is not supported with the 'python' engine in recent pandas versions
-        df = pd.read_csv(io.StringIO(text), sep=None, engine="python")
-        return df, encoding_used, detected_delimiter
-
-    def compute_stats(df: pd.DataFrame) -> Dict[str, Any]:
-        """
-        Compute required statistics and previews for the given DataFrame.
-        """
-        rows = len(df)
-        cols = df.shape[1]
-
-        dtypes_df = pd.DataFrame({
-            "Column": df.columns,
-            "Dtype": [str(dt) for dt in df.dtypes],
-        })
-
-        missing_per_col = df.isna().sum().reset_index()
-        missing_per_col.columns = ["Column", "Missing"]
-
-        total_cells = rows * cols
-        overall_missing = int(missing_per_col["Missing"].sum())
-        overall_missing_pct = (overall_missing / total_cells * 100.0) if total_cells > 0 else 0.0
-
-        duplicates_count = int(df.duplicated().sum())
-        dup_preview_df = df[df.duplicated()].head(10)
-
-        numeric_df = df.select_dtypes(include=[np.number])
-        has_numeric = not numeric_df.empty
-        if has_numeric:
-            # Describe numeric columns, show metric names, and format numbers with commas/2-decimals
-            numeric_summary_df = df.describe(include=[np.number]).round(2)
-            numeric_summary_df = numeric_summary_df.reset_index().rename(columns={"index": "Metric"})
-            def _fmt_num(v):
-                try:
-                    return f"{float(v):,.2f}"
-                except Exception:
-                    return v
-            for col in numeric_summary_df.columns:
-                if col != "Metric":
-                    numeric_summary_df[col] = numeric_summary_df[col].apply(_fmt_num)
-        else:
-            numeric_summary_df = pd.DataFrame()
-
-        preview_df = df.head(10)
-        mem_usage_bytes = int(df.memory_usage(deep=True).sum())
-
-        return {
-            "rows": rows,
-            "cols": cols,
-            "dtypes_df": dtypes_df,
-            "missing_per_col_df": missing_per_col,
-            "overall_missing": overall_missing,
-            "overall_missing_pct": overall_missing_pct,
-            "duplicates_count": duplicates_count,
-            "dup_preview_df": dup_preview_df,
-            "has_numeric": has_numeric,
-            "numeric_summary_df": numeric_summary_df,
-            "preview_df": preview_df,
-            "mem_usage_bytes": mem_usage_bytes,
-        }
-
-    def df_to_html(df: pd.DataFrame) -> str:
-        """
-        Render a DataFrame to sanitized HTML with Bootstrap table classes.
-        """
-        return df.to_html(
-            classes="table table-striped table-sm table-hover",
-            index=False,
-            escape=True,
-            border=0,
-        )
+        # endswith avoids the rsplit list + lowercased-copy allocations
+        return len(filename) > 4 and filename.lower().endswith(".csv")
 
     @app.get("/")
     def index():
@@ -179,36 +418,50 @@ def create_app(testing: bool = False) -> Flask:
             flash("Invalid file type. Only .csv files are allowed.", "danger")
             return render_template("index.html", max_size_mb=MAX_CONTENT_LENGTH // (1024 * 1024)), 400
 
+        tmp_path = None
         try:
-            data_bytes = file.read()
-            if not data_bytes or data_bytes.strip() == b"":
-                flash("Uploaded file is empty.", "danger")
-                return render_template("index.html", max_size_mb=MAX_CONTENT_LENGTH // (1024 * 1024)), 400
-
-            df, encoding_used, detected_delimiter = parse_csv_bytes(data_bytes)
-            stats = compute_stats(df)
-
-            context = {
-                "filename": filename,
-                "encoding_used": encoding_used,
-                "detected_delimiter": detected_delimiter,
-                "rows": stats["rows"],
-                "cols": stats["cols"],
-                "dtypes_html": df_to_html(stats["dtypes_df"]),
-                "missing_per_col_html": df_to_html(stats["missing_per_col_df"]),
-                "overall_missing": stats["overall_missing"],
-                "overall_missing_pct": round(stats["overall_missing_pct"], 2),
-                "duplicates_count": stats["duplicates_count"],
-                "dup_preview_html": df_to_html(stats["dup_preview_df"]) if stats["duplicates_count"] > 0 else None,
-                "has_numeric": stats["has_numeric"],
-                "numeric_summary_html": df_to_html(stats["numeric_summary_df"]) if stats["has_numeric"] else None,
-                "preview_html": df_to_html(stats["preview_df"]),
-                "mem_usage_bytes": stats["mem_usage_bytes"],
-                "mem_usage_human": human_bytes(stats["mem_usage_bytes"]),
-            }
+            # Stream the upload to disk (Werkzeug saves in chunks) instead of
+            # materializing the whole file on the Python heap.
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
+                file.save(tmp)
+                tmp_path = tmp.name
+
+            preview_mode = request.args.get("preview") == "1"
+
+            with open(tmp_path, "rb") as fh:
+                head = fh.read(10000)
+                if not head.strip():
+                    flash("Uploaded file is empty.", "danger")
+                    return render_template("index.html", max_size_mb=MAX_CONTENT_LENGTH // (1024 * 1024)), 400
+                if not preview_mode:
+                    digest = hashlib.blake2b(head, digest_size=16)
+                    while chunk := fh.read(1 << 20):
+                        digest.update(chunk)
+                    cache_key = digest.digest()
+
+            if preview_mode:
+                # Cheap enough to run inline: only the first 10 rows are parsed
+                context = preview_file(tmp_path, head)
+                flash("Preview generated successfully.", "success")
+                return render_template("results.html", filename=filename, **context), 200
+
+            cached = analysis_cache.get(cache_key)
+            if cached is not None:
+                analysis_cache.move_to_end(cache_key)
+                flash("Analysis completed successfully.", "success")
+                return render_template("results.html", filename=filename, **cached), 200
+
+            # The child process parses and renders; its peak memory is
+            # reclaimed on return, and only strings/scalars cross back.
+            future = executor.submit(analyze_file, tmp_path, head)
+            context = future.result(timeout=ANALYSIS_TIMEOUT_SECONDS)
+
+            analysis_cache[cache_key] = context
+            while len(analysis_cache) > ANALYSIS_CACHE_SIZE:
+                analysis_cache.popitem(last=False)
 
             flash("Analysis completed successfully.", "success")
-            return render_template("results.html", **context), 200
+            return render_template("results.html", filename=filename, **context), 200
 
         except pd.errors.EmptyDataError:
             flash("The CSV appears to be empty or has no columns.", "danger")
@@ -220,10 +473,20 @@ def create_app(testing: bool = False) -> Flask:
         except UnicodeDecodeError:
             flash("Failed to decode the file. Try saving as UTF-8 or Latin-1.", "danger")
             return render_template("index.html", max_size_mb=MAX_CONTENT_LENGTH // (1024 * 1024)), 400
+        except TimeoutError:
+            app.logger.error("Analysis timed out after %s s", ANALYSIS_TIMEOUT_SECONDS)
+            flash("Analysis timed out. Try a smaller file.", "danger")
+            return render_template("index.html", max_size_mb=MAX_CONTENT_LENGTH // (1024 * 1024)), 500
         except Exception:
             app.logger.exception("Unexpected error during analysis")
             flash("An unexpected error occurred while analyzing the file.", "danger")
             return render_template("index.html", max_size_mb=MAX_CONTENT_LENGTH // (1024 * 1024)), 500
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     @app.get("/health")
     def health():
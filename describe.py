@@ -0,0 +1,80 @@
+"""
+Optional Numba-accelerated numeric summary for the stats pipeline.
+
+DataFrame.describe() makes a separate pass over each column for count,
+mean, std, min, each quantile, and max; the kernel below fuses them into
+one sequential read per column (Welford for mean/std, a single sort for
+the quantiles). numba is an optional accelerator: when it is not
+installed HAVE_NUMBA is False and callers should keep using describe().
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+DESCRIBE_METRICS = ("count", "mean", "std", "min", "25%", "50%", "75%", "max")
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _quantile_sorted(vals, q):
+        # Linear interpolation between closest ranks, matching numpy/pandas
+        h = q * (vals.size - 1)
+        lo = int(h)
+        if lo + 1 >= vals.size:
+            return vals[vals.size - 1]
+        return vals[lo] + (h - lo) * (vals[lo + 1] - vals[lo])
+
+    @njit(parallel=True, cache=True)
+    def _describe_kernel(a):
+        n, m = a.shape
+        out = np.full((8, m), np.nan)
+        for j in prange(m):
+            buf = np.empty(n)
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            mn = np.inf
+            mx = -np.inf
+            for i in range(n):
+                v = a[i, j]
+                if not np.isnan(v):
+                    buf[count] = v
+                    count += 1
+                    d = v - mean
+                    mean += d / count
+                    m2 += d * (v - mean)
+                    if v < mn:
+                        mn = v
+                    if v > mx:
+                        mx = v
+            out[0, j] = count
+            if count == 0:
+                continue
+            out[1, j] = mean
+            if count > 1:
+                out[2, j] = np.sqrt(m2 / (count - 1))
+            out[3, j] = mn
+            vals = np.sort(buf[:count])
+            out[4, j] = _quantile_sorted(vals, 0.25)
+            out[5, j] = _quantile_sorted(vals, 0.50)
+            out[6, j] = _quantile_sorted(vals, 0.75)
+            out[7, j] = mx
+        return out
+
+
+def describe_numeric(numeric_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fused replacement for numeric_df.describe(): same metrics, same shape,
+    computed in one pass per column plus one sort for the quantiles.
+    Only valid when HAVE_NUMBA is True.
+    """
+    a = numeric_df.to_numpy(dtype=np.float64)
+    out = _describe_kernel(a)
+    return pd.DataFrame(out, index=list(DESCRIBE_METRICS), columns=numeric_df.columns)
@@ -0,0 +1,65 @@
+"""
+Optional Numba-accelerated duplicate-row detection for all-numeric frames.
+
+pandas' df.duplicated() factorizes every column and hashes row tuples; for
+purely numeric frames a single fused FNV-1a pass over the raw 2D array is
+several times faster. numba is an optional accelerator: when it is not
+installed HAVE_NUMBA is False and callers should keep using df.duplicated().
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _mix64(z):
+        # splitmix64 finalizer: word-at-a-time FNV alone has poor avalanche
+        # on the sparse bit patterns of small floats/ints
+        z = np.uint64(z * np.uint64(0x9E3779B97F4A7C15))
+        z = np.uint64((z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9))
+        z = np.uint64((z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB))
+        return np.uint64(z ^ (z >> np.uint64(31)))
+
+    @njit(cache=True)
+    def _dup_mask_kernel(bits):
+        n, m = bits.shape
+        out = np.zeros(n, dtype=np.bool_)
+        seen = {}
+        for i in range(n):
+            h = np.uint64(1469598103934665603)
+            for j in range(m):
+                h = np.uint64((h ^ _mix64(np.uint64(bits[i, j]))) * np.uint64(1099511628211))
+            if h in seen:
+                # Verify against the first row with this hash so a stray
+                # collision can never mark a unique row as a duplicate
+                k = seen[h]
+                eq = True
+                for j in range(m):
+                    if bits[i, j] != bits[k, j]:
+                        eq = False
+                        break
+                out[i] = eq
+            else:
+                seen[h] = i
+        return out
+
+
+def dup_mask_numeric(values: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of duplicate rows (keep='first') for a 2D int/float array.
+    The array is viewed as unsigned words of its native width -- downcast
+    frames (int8, float32, ...) stay compact -- and rows are compared by a
+    64-bit hash of those words, with an equality check on hash hits so
+    unique rows are never falsely flagged. Note that 0.0 and -0.0 compare
+    unequal here, unlike pandas. Only valid when HAVE_NUMBA is True.
+    """
+    values = np.ascontiguousarray(values)
+    bits = values.view(f"u{values.dtype.itemsize}")
+    return _dup_mask_kernel(bits)